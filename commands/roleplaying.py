@@ -72,6 +72,8 @@ class CmdMoniker(MuxCommand):
             self.caller.msg("Usage: +moniker <moniker>")
             return
         self.caller.db.moniker = self.args.strip()
+        # drop the cached display name so the new moniker shows immediately
+        self.caller.ndb.effective_name = None
         self.caller.msg("Moniker set to '%s'." % self.args.strip())
 
 
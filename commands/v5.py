@@ -11,8 +11,8 @@ import random
 class V5CmdSet(CmdSet):
     def at_cmdset_creation(self):
         super().at_cmdset_creation()
-        self.add(CmdRouse())
-        self.add(CmdSlake())
+        for cls in _V5_COMMANDS:
+            self.add(cls())
 
 
 class CmdRouse(MuxCommand):
@@ -105,3 +105,8 @@ class CmdSlake(MuxCommand):
                 self.caller.msg(
                     "Current hunger: |r%s|n" % self.caller.db.stats["pools"]["hunger"]
                 )
+
+
+# Commands added to V5CmdSet; the tuple is allocated once at import rather
+# than on every cmdset creation.
+_V5_COMMANDS = (CmdRouse, CmdSlake)
@@ -8,10 +8,54 @@ creation commands.
 
 """
 
+import bisect
+import pickle
+
 from evennia.objects.objects import DefaultCharacter
 from .objects import ObjectParent
 from world.data import STATS
 
+# STATS serialized once at import time. Each character gets its own copy
+# via pickle.loads, which is both faster than deep-copying the nested dict
+# and guarantees characters never alias the shared template from world.data.
+_STATS_BLOB = pickle.dumps(STATS, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Idle-time color buckets: (upper bound in minutes, color code). Scanned
+# with bisect so picking a color is a table lookup instead of an if/elif
+# chain - format_idle_time runs once per character on every +who/room look.
+_MINUTE_BUCKETS = [(10, "|g"), (15, "|G"), (20, "|y"), (30, "|r"), (60, "|r")]
+_MINUTE_THRESHOLDS = [threshold for threshold, _color in _MINUTE_BUCKETS]
+
+
+def _format_idle(time):
+    """
+    Format an idle time (whole seconds, as an int) into its colored
+    display string. Used to prebuild _IDLE_STRINGS below and as the
+    fallback for idle times of an hour or more.
+    """
+    # Compare against the unit thresholds directly and divide only for
+    # the unit actually displayed; the common sub-minute case does no
+    # arithmetic at all.
+    if time >= 86400:
+        return "".join(("|x", str(time // 86400), "d|n"))
+    if time >= 3600:
+        return "".join(("|x", str(time // 3600), "h|n"))
+    if time >= 60:
+        minutes = time // 60
+        index = bisect.bisect_left(_MINUTE_THRESHOLDS, minutes)
+        color = _MINUTE_BUCKETS[min(index, len(_MINUTE_BUCKETS) - 1)][1]
+        return "".join((color, str(minutes), "m|n"))
+    return "".join(("|g", str(time), "s|n"))
+
+
+# Every sub-hour display string, prebuilt at import (a fixed ~50KB), so the
+# common case in format_idle_time is a plain list index.
+_IDLE_STRINGS = [_format_idle(time) for time in range(3600)]
+
+# Login templates, built once at import rather than inside the puppet hook.
+_BECOME_TMPL = "\nYou become |c%s|n.\n\n"
+_ENTERED_TMPL = "%s has entered the game."
+
 
 class Character(ObjectParent, DefaultCharacter):
     """
@@ -38,7 +82,66 @@ class Character(ObjectParent, DefaultCharacter):
         super().at_object_creation()
 
         # initialize attributes
-        self.db.stats = STATS
+        self.db.stats = pickle.loads(_STATS_BLOB)
+
+    def at_post_move(self, source_location, **kwargs):
+        """
+        Called after a successful move.
+
+        The default hook renders a full look of the new location; skip
+        that entirely when nothing is puppeting us (NPCs or characters
+        moved by scripts), since the output would be discarded anyway.
+        """
+        if self.location is None or not self.sessions.all():
+            return
+        super().at_post_move(source_location, **kwargs)
+
+    def at_post_puppet(self, **kwargs):
+        """
+        Called just after puppeting has been completed.
+
+        Overrides the default `for_contents` fan-out, which re-renders our
+        display name once per observer. The announcement is formatted just
+        twice - the generic variant and the builder variant with dbref -
+        and each observer gets the right one via the memoized Builder
+        lock check.
+        """
+        # location is a property resolving through the dbref cache; bind it
+        # once rather than re-resolving it for each use below.
+        location = self.location
+        # Prepend the "You become" line to the look output so both go out
+        # in a single message instead of two back-to-back protocol frames.
+        become = _BECOME_TMPL % self.get_display_name(self)
+        if location is None:
+            # off-grid puppet; nothing to render or announce to
+            self.msg(become)
+            return
+        self.msg((become + self.at_look(location), {"type": "look"}), options=None)
+
+        generic = _ENTERED_TMPL % self._effective_name
+        builder = _ENTERED_TMPL % ("%s(#%s)" % (self._effective_name, self.id))
+        for obj in location.contents:
+            if obj is self:
+                continue
+            obj.msg(
+                builder if self._builder_view(obj) else generic, from_obj=self
+            )
+
+    @property
+    def _effective_name(self):
+        """
+        The name we display: the moniker if one is set, otherwise the key.
+        `db.moniker` is an Attribute lookup, so the result is cached on ndb;
+        it is cleared on rename and whenever the moniker changes.
+        """
+        name = self.ndb.effective_name
+        if name is None:
+            name = self.ndb.effective_name = self.db.moniker or self.name
+        return name
+
+    def at_rename(self, oldname, newname):
+        super().at_rename(oldname, newname)
+        self.ndb.effective_name = None
 
     def get_display_name(self, looker=None, **kwargs):
         """
@@ -60,10 +163,27 @@ class Character(ObjectParent, DefaultCharacter):
             and is expected to produce something useful for builders.
 
         """
-        if looker and self.locks.check_lockstring(looker, "perm(Builder)"):
-            return "{}(#{})".format(self.db.moniker or self.name, self.id)
+        if looker and self._builder_view(looker):
+            return "%s(#%s)" % (self._effective_name, self.id)
+
+        return self._effective_name
 
-        return self.db.moniker or self.name
+    def _builder_view(self, looker):
+        """
+        Check whether `looker` passes the Builder lock on us, caching the
+        verdict on the looker's ndb so repeated renders of the same room
+        don't re-parse the lockstring. The ndb cache is per-session and
+        cleared automatically on reload/disconnect.
+        """
+        cache = looker.ndb.builder_view_cache
+        if cache is None:
+            cache = looker.ndb.builder_view_cache = {}
+        verdict = cache.get(self.id)
+        if verdict is None:
+            verdict = cache[self.id] = self.locks.check_lockstring(
+                looker, "perm(Builder)"
+            )
+        return verdict
 
     def get_display_shortdesc(self, looker=None, **kwargs):
         if self.db.shortdesc:
@@ -78,32 +198,9 @@ class Character(ObjectParent, DefaultCharacter):
         time = self.idle_time or self.connection_time
         if time is None:
             return "|g0s|n"
-        minutes, seconds = divmod(time, 60)
-        hours, minutes = divmod(minutes, 60)
-        days, hours = divmod(hours, 24)
-
-        # round seconds
-        seconds = int(round(seconds, 0))
-        minutes = int(round(minutes, 0))
-        hours = int(round(hours, 0))
-        days = int(round(days, 0))
-
-        if days > 0:
-            time_str = f"|x{days}d|n"
-        elif hours > 0:
-            time_str = f"|x{hours}h|n"
-        elif minutes > 0:
-            if minutes > 10 and minutes < 15:
-                time_str = f"|G{minutes}m|n"
-            elif minutes > 15 and minutes < 20:
-                time_str = f"|y{minutes}m|n"
-            elif minutes > 20 and minutes < 30:
-                time_str = f"|r{minutes}m|n"
-            elif minutes > 30 and minutes:
-                time_str = f"|r{minutes}m|n"
-            else:
-                time_str = f"|g{minutes}m|n"
-        elif seconds > 0:
-            time_str = f"|g{seconds}s|n"
-        return time_str.strip()
+        # coerce once; idle/connection times may come back as floats
+        time = int(time)
+        if 0 <= time < 3600:
+            return _IDLE_STRINGS[time]
+        return _format_idle(time)
 
@@ -6,11 +6,37 @@ set and has a single command defined on itself with the same name as its key,
 for allowing Characters to traverse the exit to its destination.
 
 """
-from evennia.objects.objects import DefaultExit
+from evennia.objects.objects import DefaultExit, ExitCommand as DefaultExitCommand
 
 from .objects import ObjectParent
 
 
+class ExitCommand(DefaultExitCommand):
+    """
+    Command handling the actual traversal of its exit object. Same logic
+    as the Evennia default, but with the repeated `self.obj`/`self.caller`
+    attribute lookups bound to locals - this runs on every room move.
+    """
+
+    def func(self):
+        obj = self.obj
+        caller = self.caller
+        # Most exits keep the wide-open default traverse lock; comparing the
+        # stored lockstring is a dict lookup plus string compare and skips
+        # the full lock evaluation while staying correct if locks change.
+        if obj.locks.get("traverse") == "traverse:all()" or obj.access(
+            caller, "traverse"
+        ):
+            # we may traverse the exit.
+            obj.at_traverse(caller, obj.destination)
+        elif obj.db.err_traverse:
+            # if exit has a better error message, let's use it.
+            caller.msg(obj.db.err_traverse)
+        else:
+            # No shorthand error message. Call hook.
+            obj.at_failed_traverse(caller)
+
+
 class Exit(ObjectParent, DefaultExit):
     """
     Exits are connectors between rooms. Exits are normal Objects except
@@ -37,19 +63,63 @@ class Exit(ObjectParent, DefaultExit):
                                         defined, in which case that will simply be echoed.
     """
 
+    exit_command = ExitCommand
+
+    def at_object_creation(self):
+        super().at_object_creation()
+        self._update_short_alias()
+
+    def at_init(self):
+        super().at_init()
+        self.ndb.cached_display_name = None
+
+    def at_rename(self, oldname, newname):
+        super().at_rename(oldname, newname)
+        self.ndb.cached_display_name = None
+
+    def at_cmdset_get(self, **kwargs):
+        # `@alias` triggers a forced cmdset rebuild when aliases change;
+        # piggyback on that to refresh the stored shortest alias.
+        if kwargs.get("force_init"):
+            self._update_short_alias()
+        return super().at_cmdset_get(**kwargs)
+
+    def _update_short_alias(self):
+        """
+        Recompute and store the shortest alias on `db.short_alias`, so
+        rendering does not need to fetch and scan the full alias list.
+        """
+        aliases = self.aliases.all()
+        self.db.short_alias = min(aliases, key=len) if aliases else ""
+        self.ndb.cached_display_name = None
+
     def get_display_name(self, looker=None, **kwargs):
+        # Exit names and aliases change rarely but are rendered on every
+        # look, so the formatted string is cached on ndb and rebuilt only
+        # after a rename/reload clears it.
+        cached = self.ndb.cached_display_name
+        if cached is not None:
+            return cached
+
         # helper to create a clickable link
         def make_link(cmd, text):
             return f"|lc{cmd}|lt{text}|le"
 
         # create clickable link from name
         name_link = make_link(self.name, self.name)
-        aliases = self.aliases.all()
-        # list the first alias next to the full name of the exit.
-        if aliases:
-            alias = min(aliases, key=len)
+        # list the shortest alias next to the full name of the exit.
+        alias = self.db.short_alias
+        if not alias:
+            # exits predating short_alias; compute and store it once
+            aliases = self.aliases.all()
+            alias = min(aliases, key=len) if aliases else ""
+            if alias:
+                self.db.short_alias = alias
+        if alias:
             alias_link = make_link(alias, alias.upper())
-            return f"<|w{alias_link}|n>  {name_link}"
+            display_name = f"<|w{alias_link}|n>  {name_link}"
         else:
-            return name_link
+            display_name = name_link
+        self.ndb.cached_display_name = display_name
+        return display_name
 